@@ -8,34 +8,72 @@ Each section file includes the document title and TOC as context.
 """
 
 import sys
+import os
 import re
 import shutil
+import functools
 from pathlib import Path
 
-
-def extract_sections(plan_path: Path) -> list[dict]:
-    """Split a markdown file into sections on H2 (or H1 if no H2s) boundaries."""
-    content = plan_path.read_text(encoding="utf-8")
-    lines = content.splitlines()
-
-    # Extract title (first H1)
+# Compiled once at import — these run against every line of the document.
+_TOC_RE = re.compile(r"^##\s+(table of contents|toc|contents)\s*$", re.IGNORECASE)
+_TOC_NAME_RE = re.compile(r"(table of contents|toc|contents)$", re.IGNORECASE)
+_SANITIZE_RE = re.compile(r"[^a-z0-9]+")
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
+
+
+def extract_sections(plan_path: Path) -> tuple[str, list[dict]]:
+    """Split a markdown file into sections on H2 (or H3/H1 fallback) boundaries.
+
+    Returns (context, sections): the shared context header (title + TOC) is
+    returned once instead of being concatenated into every section's content.
+    """
+    # read_bytes + one decode skips the text-I/O layer; split("\n") is a
+    # literal scan, unlike splitlines' full Unicode line-break search.
+    # CRLF plans are mainline input on Windows, so normalize explicitly —
+    # the bytes path has no universal-newline translation.
+    content = plan_path.read_bytes().decode("utf-8").replace("\r\n", "\n")
+    lines = content.split("\n")
+    if lines and lines[-1] == "":
+        lines.pop()  # drop the empty tail from a trailing newline
+
+    # Single pass: record the title, the TOC range, and every H1/H2/H3
+    # heading as (line_index, heading_text). Sections are materialized
+    # afterwards by slicing between consecutive heading indices.
     title = "# Untitled Document"
-    for line in lines:
-        if line.startswith("# ") and not line.startswith("## "):
-            title = line
-            break
-
-    # Extract TOC if present
-    toc_lines = []
-    in_toc = False
-    for line in lines:
-        if re.match(r"^##\s+(table of contents|toc|contents)\s*$", line, re.IGNORECASE):
-            in_toc = True
+    title_idx = -1
+    h1_idx: list[tuple[int, str]] = []
+    h2_idx: list[tuple[int, str]] = []
+    h3_idx: list[tuple[int, str]] = []
+    toc_start = -1
+    toc_end = -1
+
+    for i, line in enumerate(lines):
+        # Cheap prefilter: most lines aren't headings, so skip the
+        # startswith calls unless the line begins with '#'.
+        if not line or line[0] != "#":
             continue
-        if in_toc:
-            if line.startswith("## "):
-                break
-            toc_lines.append(line)
+        m = _HEADING_RE.match(line)
+        if not m:
+            continue
+        level = len(m.group(1))
+        if level == 1:
+            if title_idx < 0:
+                title = line
+                title_idx = i
+            h1_idx.append((i, m.group(2).strip()))
+        elif level == 2:
+            h2_idx.append((i, m.group(2).strip()))
+            if toc_start < 0 and _TOC_RE.match(line):
+                toc_start = i + 1
+            elif toc_start >= 0 and toc_end < 0:
+                toc_end = i
+        elif level == 3:
+            h3_idx.append((i, m.group(2).strip()))
+
+    # Extract TOC if present (runs to the next H2, or EOF)
+    toc_lines = []
+    if toc_start >= 0:
+        toc_lines = lines[toc_start:toc_end if toc_end >= 0 else len(lines)]
 
     # Build context header
     context = f"{title}\n\n"
@@ -46,72 +84,54 @@ def extract_sections(plan_path: Path) -> list[dict]:
     context += "*The following is one section from the above document, extracted for focused review.*\n"
     context += "---\n\n"
 
-    # Try splitting on H2 first, then H3, then H1
-    sections = _split_on_heading(lines, level=2, title=title)
-
-    # Fall back to H3 if no H2 sections found (common in implementation plans
-    # that use ### Task N headers)
-    if not sections:
-        sections = _split_on_heading(lines, level=3, title=title)
-
-    # Fall back to H1 if no H2 or H3 sections found
-    if not sections:
-        sections = _split_on_heading(lines, level=1, title=title)
-
-    # Last resort: whole document as one section
-    if not sections:
+    # Prefer H2 boundaries, then H3 (common in implementation plans that
+    # use ### Task N headers), then H1 with the document title skipped.
+    headings = h2_idx or h3_idx
+    if not headings:
+        # The title's line index is already known, so an integer compare
+        # beats re-matching the title string against each H1 line.
+        headings = [(i, text) for i, text in h1_idx if i != title_idx]
+
+    if headings:
+        starts = [i for i, _ in headings] + [len(lines)]
+        sections = [
+            {
+                "name": text,
+                "content": "\n".join(lines[starts[j]:starts[j + 1]]),
+            }
+            for j, (_, text) in enumerate(headings)
+        ]
+    else:
+        # Last resort: whole document as one section
         sections = [{"name": "full-document", "content": content}]
 
     # Filter out TOC section
     sections = [
         s for s in sections
-        if not re.match(r"(table of contents|toc|contents)$", s["name"], re.IGNORECASE)
+        if not _TOC_NAME_RE.match(s["name"])
     ]
 
-    # Prepend context to each section
-    for s in sections:
-        s["content"] = context + s["content"]
-
-    return sections
-
-
-def _split_on_heading(lines: list[str], level: int, title: str) -> list[dict]:
-    """Split lines into sections based on heading level."""
-    prefix = "#" * level + " "
-    sections = []
-    current_name = None
-    current_lines = []
-
-    for line in lines:
-        if line.startswith(prefix):
-            heading_text = line[len(prefix):].strip()
-            # Skip if this is the document title (for H1 splitting)
-            if level == 1 and line == title:
-                continue
-            # Save previous section
-            if current_name is not None:
-                sections.append({
-                    "name": current_name,
-                    "content": "\n".join(current_lines),
-                })
-            current_name = heading_text
-            current_lines = [line]
-        elif current_name is not None:
-            current_lines.append(line)
-
-    # Don't forget the last section
-    if current_name is not None:
-        sections.append({
-            "name": current_name,
-            "content": "\n".join(current_lines),
-        })
-
-    return sections
+    return context, sections
+
+
+@functools.lru_cache(maxsize=4)
+def _extract_sections_cached(path_str: str, mtime_ns: int, size: int) -> tuple[str, list[dict]]:
+    return extract_sections(Path(path_str))
+
+
+def extract_sections_cached(plan_path: Path) -> tuple[str, list[dict]]:
+    """extract_sections memoized on (path, mtime, size) for in-process reuse.
+
+    Repeated extraction of an unchanged plan (e.g. several review types in
+    one process) returns the cached result; callers must not mutate it.
+    """
+    st = plan_path.stat()
+    return _extract_sections_cached(str(plan_path), st.st_mtime_ns, st.st_size)
 
 
 def sanitize_filename(name: str) -> str:
     """Convert a section name to a safe filename."""
-    safe = re.sub(r"[^a-z0-9]+", "-", name.lower())
+    safe = _SANITIZE_RE.sub("-", name.lower())
     return safe.strip("-")
 
 
@@ -125,6 +145,11 @@ def main():
         print(f"Error: File not found: {plan_path}", file=sys.stderr)
         sys.exit(1)
 
+    extract_and_write(plan_path)
+
+
+def extract_and_write(plan_path: Path) -> None:
+    """Extract sections from a plan and write them under .codex-review/."""
     review_dir = plan_path.parent / ".codex-review"
     sections_dir = review_dir / "sections"
 
@@ -135,18 +160,28 @@ def main():
     (review_dir / "feedback" / "pass1").mkdir(parents=True, exist_ok=True)
     (review_dir / "feedback" / "pass2").mkdir(parents=True, exist_ok=True)
 
-    sections = extract_sections(plan_path)
+    context, sections = extract_sections_cached(plan_path)
 
+    # Encode the shared context once and write raw bytes per section,
+    # skipping the TextIOWrapper setup and re-encoding for every file.
+    ctx_bytes = context.encode("utf-8")
     for i, section in enumerate(sections, 1):
         safe_name = sanitize_filename(section["name"])
         filename = f"{i:02d}-{safe_name}.md"
         out_path = sections_dir / filename
-        out_path.write_text(section["content"], encoding="utf-8")
+        fd = os.open(str(out_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, ctx_bytes)
+            os.write(fd, section["content"].encode("utf-8"))
+        finally:
+            os.close(fd)
 
     print(f"Extracted {len(sections)} sections to {sections_dir}")
-    for f in sorted(sections_dir.iterdir()):
-        if not f.name.startswith("_"):
-            print(f"  {f.name}")
+    # os.scandir avoids the per-entry stat that Path.iterdir incurs
+    with os.scandir(sections_dir) as it:
+        names = sorted(e.name for e in it if not e.name.startswith("_"))
+    for name in names:
+        print(f"  {name}")
 
 
 if __name__ == "__main__":
@@ -13,14 +13,16 @@ Single-round mode (--round N): runs only round N. Useful when Claude Code drives
 
 import sys
 import subprocess
+import functools
 import os
-import re
+import hashlib
 import shutil
 import argparse
+import time
 from pathlib import Path
-from datetime import datetime, timezone
 
 
+@functools.cache
 def find_codex() -> str:
     """Find the codex executable, handling Windows npm quirks."""
     import shutil
@@ -43,8 +45,14 @@ def run_codex(
     model: str | None = None,
     verbose: bool = False,
     resume: bool = False,
+    output_path: Path | None = None,
 ) -> str:
-    """Run codex exec (or resume), piping the prompt via stdin."""
+    """Run codex exec (or resume), piping the prompt via stdin.
+
+    With output_path set, stdout streams to that file (appended) as Codex
+    produces it, so a timeout preserves partial output; returns "" in that
+    mode instead of the captured text.
+    """
     codex_bin = find_codex()
     use_shell = sys.platform == "win32" and not codex_bin
 
@@ -63,12 +71,33 @@ def run_codex(
 
     cmd.append("-")  # Read prompt from stdin
 
+    stderr = None if verbose else subprocess.DEVNULL
+
     try:
+        if output_path is not None:
+            with output_path.open("a", encoding="utf-8") as out:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.PIPE,
+                    stdout=out,
+                    stderr=stderr,
+                    text=True,
+                    shell=use_shell,
+                    encoding="utf-8",
+                )
+                try:
+                    proc.communicate(input=prompt, timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.communicate()
+                    raise TimeoutError(f"Codex timed out after {timeout}s")
+            return ""
+
         result = subprocess.run(
             cmd,
             input=prompt,
             stdout=subprocess.PIPE,
-            stderr=None if verbose else subprocess.DEVNULL,
+            stderr=stderr,
             text=True,
             timeout=timeout,
             shell=use_shell,
@@ -82,9 +111,16 @@ def run_codex(
         sys.exit(1)
 
 
+@functools.lru_cache(maxsize=8)
+def _load_prompt(path: str) -> str:
+    """Read a prompt file once per process; repeated rounds reuse the cached text."""
+    return Path(path).read_text(encoding="utf-8")
+
+
 def count_issues(text: str) -> int:
     """Count critical and warning findings."""
-    return len(re.findall(r"🔴|🟡", text))
+    # str.count's C-level scan beats a regex alternation for two literals.
+    return text.count("🔴") + text.count("🟡")
 
 
 def main():
@@ -134,7 +170,7 @@ def main():
             shutil.rmtree(iteration_dir)
     iteration_dir.mkdir(parents=True, exist_ok=True)
 
-    review_prompt = prompt_path.read_text(encoding="utf-8")
+    review_prompt = _load_prompt(str(prompt_path))
 
     # --- Determine which rounds to run ---
     if args.single_round is not None:
@@ -144,6 +180,8 @@ def main():
 
     prev_issues = 0
     last_result = ""
+    round_issue_counts: list[tuple[str, int]] = []
+    prev_hash: bytes | None = None
 
     for round_num in rounds_to_run:
         round_file = iteration_dir / f"round-{round_num:02d}.md"
@@ -165,24 +203,30 @@ def main():
 
 After your review, I will revise the section and show you the updated version. You will then evaluate whether your concerns were addressed. We may go through multiple rounds of this."""
 
-            try:
-                result = run_codex(full_prompt, timeout=timeout, model=model, verbose=verbose, resume=False)
-            except TimeoutError as e:
-                print(str(e), file=sys.stderr)
-                sys.exit(1)
-
-            now = datetime.now(timezone.utc).isoformat()
-            round_file.write_text(
+            # Header first, then stream Codex output into the round file so a
+            # timeout still leaves the partial review on disk.
+            now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            header = (
                 f"# Iteration Round 1: Initial Review\n"
                 f"**Section**: {section_basename}\n"
                 f"**Review type**: {review_type}\n"
                 f"**Date**: {now}\n\n"
-                f"{result}\n",
-                encoding="utf-8",
             )
+            round_file.write_text(header, encoding="utf-8")
+
+            try:
+                run_codex(full_prompt, timeout=timeout, model=model, verbose=verbose,
+                          resume=False, output_path=round_file)
+            except TimeoutError as e:
+                print(str(e), file=sys.stderr)
+                print(f"Partial output (if any) is in: {round_file}", file=sys.stderr)
+                sys.exit(1)
+
+            result = round_file.read_text(encoding="utf-8")[len(header):]
 
             prev_issues = count_issues(result)
             last_result = result
+            round_issue_counts.append((round_file.name, prev_issues))
             print(f"✓ Round 1 feedback: {round_file}", file=sys.stderr)
             print(f"  Issues found: {prev_issues}", file=sys.stderr)
 
@@ -206,6 +250,14 @@ After your review, I will revise the section and show you the updated version. Y
 
             revised_content = revised_path.read_text(encoding="utf-8")
 
+            # Don't burn a Codex round on content identical to the last one
+            # we submitted — hashing is microseconds, a review is seconds.
+            revised_hash = hashlib.blake2b(revised_content.encode("utf-8"), digest_size=16).digest()
+            if revised_hash == prev_hash:
+                print(f"Round {round_num}: no changes detected in {revised_path}, skipping.", file=sys.stderr)
+                continue
+            prev_hash = revised_hash
+
             print(f"=== Round {round_num}/{max_rounds}: Re-review after revision ===", file=sys.stderr)
 
             resume_prompt = f"""Here is the revised version of the section, updated based on your previous feedback.
@@ -225,31 +277,38 @@ If all critical and warning issues are resolved, state: "✅ SECTION APPROVED 
 
 {revised_content}"""
 
+            # Header first, then stream Codex output into the round file so a
+            # timeout still leaves the partial review on disk.
+            now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            header = (
+                f"# Iteration Round {round_num}\n"
+                f"**Date**: {now}\n\n"
+            )
+            round_file.write_text(header, encoding="utf-8")
+
             try:
-                result = run_codex(resume_prompt, timeout=timeout, model=model, verbose=verbose, resume=True)
+                run_codex(resume_prompt, timeout=timeout, model=model, verbose=verbose,
+                          resume=True, output_path=round_file)
             except TimeoutError as e:
                 print(str(e), file=sys.stderr)
-                result = ""
 
-            # If resume failed (empty result), fall back to fresh exec
-            if not result:
+            result = round_file.read_text(encoding="utf-8")[len(header):]
+
+            # If resume produced nothing (failed or timed out), fall back to fresh exec
+            if not result.strip():
                 print("Resume failed, falling back to fresh exec...", file=sys.stderr)
+                round_file.write_text(header, encoding="utf-8")
                 try:
-                    result = run_codex(resume_prompt, timeout=timeout, model=model, verbose=verbose, resume=False)
+                    run_codex(resume_prompt, timeout=timeout, model=model, verbose=verbose,
+                              resume=False, output_path=round_file)
                 except TimeoutError:
                     print(f"Error: Fresh exec also timed out on round {round_num}.", file=sys.stderr)
                     sys.exit(1)
-
-            now = datetime.now(timezone.utc).isoformat()
-            round_file.write_text(
-                f"# Iteration Round {round_num}\n"
-                f"**Date**: {now}\n\n"
-                f"{result}\n",
-                encoding="utf-8",
-            )
+                result = round_file.read_text(encoding="utf-8")[len(header):]
 
             current_issues = count_issues(result)
             last_result = result
+            round_issue_counts.append((round_file.name, current_issues))
             print(f"✓ Round {round_num} feedback: {round_file}", file=sys.stderr)
             print(f"  Issues: {current_issues} (was: {prev_issues})", file=sys.stderr)
 
@@ -275,10 +334,17 @@ If all critical and warning issues are resolved, state: "✅ SECTION APPROVED 
         "",
         "## Round History",
     ]
-    for f in sorted(iteration_dir.glob("round-*.md")):
-        text = f.read_text(encoding="utf-8")
-        issues = count_issues(text)
-        summary_lines.append(f"- {f.name}: {issues} issues")
+    # Counts for rounds run in this invocation are already in memory; only
+    # single-round mode needs to read earlier rounds back from disk.
+    if args.single_round is not None:
+        known = {name for name, _ in round_issue_counts}
+        for f in sorted(iteration_dir.glob("round-*.md")):
+            if f.name not in known:
+                round_issue_counts.append((f.name, count_issues(f.read_text(encoding="utf-8"))))
+        round_issue_counts.sort()
+
+    for name, issues in round_issue_counts:
+        summary_lines.append(f"- {name}: {issues} issues")
 
     (iteration_dir / "summary.md").write_text("\n".join(summary_lines) + "\n", encoding="utf-8")
 
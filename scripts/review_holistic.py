@@ -9,11 +9,18 @@ so Codex can verify they were addressed.
 
 import sys
 import subprocess
+import functools
 import os
+import time
 from pathlib import Path
-from datetime import datetime, timezone
 
+# Environment configuration, read once at import
+_ENV_TIMEOUT = int(os.environ.get("CODEX_REVIEW_TIMEOUT", "180"))  # Longer default
+_ENV_VERBOSE = os.environ.get("CODEX_REVIEW_VERBOSE", "0") == "1"
+_ENV_MODEL = os.environ.get("CODEX_REVIEW_MODEL")
 
+
+@functools.cache
 def find_codex() -> str:
     """Find the codex executable, handling Windows npm quirks."""
     import shutil
@@ -30,8 +37,19 @@ def find_codex() -> str:
     return ""
 
 
-def run_codex(prompt: str, timeout: int, model: str | None = None, verbose: bool = False) -> str:
-    """Run codex exec, piping the prompt via stdin to avoid CLI length limits."""
+def run_codex(
+    prompt: str,
+    timeout: int,
+    model: str | None = None,
+    verbose: bool = False,
+    output_path: Path | None = None,
+) -> str:
+    """Run codex exec, piping the prompt via stdin to avoid CLI length limits.
+
+    With output_path set, stdout streams to that file (appended) as Codex
+    produces it, so a timeout preserves partial output; returns "" in that
+    mode instead of the captured text.
+    """
     codex_bin = find_codex()
     use_shell = sys.platform == "win32" and not codex_bin
 
@@ -44,12 +62,33 @@ def run_codex(prompt: str, timeout: int, model: str | None = None, verbose: bool
         cmd.extend(["-m", model])
     cmd.append("-")  # Read prompt from stdin
 
+    stderr = None if verbose else subprocess.DEVNULL
+
     try:
+        if output_path is not None:
+            with output_path.open("a", encoding="utf-8") as out:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.PIPE,
+                    stdout=out,
+                    stderr=stderr,
+                    text=True,
+                    shell=use_shell,
+                    encoding="utf-8",
+                )
+                try:
+                    proc.communicate(input=prompt, timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.communicate()
+                    raise TimeoutError(f"Codex timed out after {timeout}s")
+            return ""
+
         result = subprocess.run(
             cmd,
             input=prompt,
             stdout=subprocess.PIPE,
-            stderr=None if verbose else subprocess.DEVNULL,
+            stderr=stderr,
             text=True,
             timeout=timeout,
             shell=use_shell,
@@ -70,9 +109,9 @@ def main():
 
     plan_path = Path(sys.argv[1])
     pass1_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else None
-    timeout = int(os.environ.get("CODEX_REVIEW_TIMEOUT", "180"))  # Longer default
-    verbose = os.environ.get("CODEX_REVIEW_VERBOSE", "0") == "1"
-    model = os.environ.get("CODEX_REVIEW_MODEL")
+    timeout = _ENV_TIMEOUT
+    verbose = _ENV_VERBOSE
+    model = _ENV_MODEL
 
     if not plan_path.is_file():
         print(f"Error: Plan file not found: {plan_path}", file=sys.stderr)
@@ -88,19 +127,23 @@ def main():
     script_dir = Path(__file__).resolve().parent
     holistic_prompt = (script_dir.parent / "prompts" / "holistic.md").read_text(encoding="utf-8")
 
-    plan_content = plan_path.read_text(encoding="utf-8")
+    plan_content = plan_path.read_bytes().decode("utf-8").replace("\r\n", "\n")
 
     # Collect pass 1 feedback if available
     pass1_summary = ""
     if pass1_dir and pass1_dir.is_dir():
-        pass1_summary = (
+        # Collect parts and join once — repeated += on a growing string
+        # reallocates the whole summary for every feedback file.
+        parts = [
             "## Previous Review Findings (Pass 1)\n\n"
             "The following issues were identified in a section-by-section review. "
             "Verify whether these have been addressed in the current version of the document. "
             "Flag any that remain unresolved.\n\n"
-        )
+        ]
         for f in sorted(pass1_dir.glob("*-review.md")):
-            pass1_summary += f.read_text(encoding="utf-8") + "\n\n---\n\n"
+            parts.append(f.read_text(encoding="utf-8"))
+            parts.append("\n\n---\n\n")
+        pass1_summary = "".join(parts)
 
     full_prompt = f"""{holistic_prompt}
 
@@ -114,29 +157,30 @@ def main():
 
     print(f"Running holistic review on: {plan_path.name}...", file=sys.stderr)
 
+    # Write the header first, then stream Codex output straight into the
+    # feedback file so a timeout still leaves the partial review on disk.
+    now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    has_pass1 = "yes" if pass1_dir and pass1_dir.is_dir() else "no"
+    feedback_path.write_text(
+        f"# Holistic Review\n"
+        f"**Date**: {now}\n"
+        f"**Document**: {plan_path.name}\n"
+        f"**Pass 1 feedback included**: {has_pass1}\n\n",
+        encoding="utf-8",
+    )
+
     try:
-        result = run_codex(full_prompt, timeout=timeout, model=model, verbose=verbose)
+        run_codex(full_prompt, timeout=timeout, model=model, verbose=verbose, output_path=feedback_path)
     except TimeoutError as e:
         print(str(e), file=sys.stderr)
-        feedback_path.write_text(
-            "# Holistic Review\n\n"
-            f"**⚠️ TIMEOUT** — Codex did not complete within {timeout}s. "
-            "The document may be too large for a single holistic pass. "
-            "Consider increasing CODEX_REVIEW_TIMEOUT.\n",
-            encoding="utf-8",
-        )
+        with feedback_path.open("a", encoding="utf-8") as fh:
+            fh.write(
+                f"\n\n**⚠️ TIMEOUT** — Codex did not complete within {timeout}s; "
+                "output above may be partial. The document may be too large for "
+                "a single holistic pass. Consider increasing CODEX_REVIEW_TIMEOUT.\n"
+            )
         sys.exit(1)
 
-    now = datetime.now(timezone.utc).isoformat()
-    has_pass1 = "yes" if pass1_dir and pass1_dir.is_dir() else "no"
-    feedback = f"""# Holistic Review
-**Date**: {now}
-**Document**: {plan_path.name}
-**Pass 1 feedback included**: {has_pass1}
-
-{result}
-"""
-    feedback_path.write_text(feedback, encoding="utf-8")
     print(f"✓ Holistic feedback written to: {feedback_path}", file=sys.stderr)
 
 
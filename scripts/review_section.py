@@ -7,11 +7,18 @@ review-type: architecture (default), implementation, api, data
 
 import sys
 import subprocess
+import functools
 import os
+import time
 from pathlib import Path
-from datetime import datetime, timezone
 
+# Environment configuration, read once at import
+_ENV_TIMEOUT = int(os.environ.get("CODEX_REVIEW_TIMEOUT", "120"))
+_ENV_VERBOSE = os.environ.get("CODEX_REVIEW_VERBOSE", "0") == "1"
+_ENV_MODEL = os.environ.get("CODEX_REVIEW_MODEL")
 
+
+@functools.cache
 def find_codex() -> str:
     """Find the codex executable, handling Windows npm quirks."""
     import shutil
@@ -30,8 +37,19 @@ def find_codex() -> str:
     return ""
 
 
-def run_codex(prompt: str, timeout: int, model: str | None = None, verbose: bool = False) -> str:
-    """Run codex exec, piping the prompt via stdin to avoid CLI length limits."""
+def run_codex(
+    prompt: str,
+    timeout: int,
+    model: str | None = None,
+    verbose: bool = False,
+    output_path: Path | None = None,
+) -> str:
+    """Run codex exec, piping the prompt via stdin to avoid CLI length limits.
+
+    With output_path set, stdout streams to that file (appended) as Codex
+    produces it, so a timeout preserves partial output; returns "" in that
+    mode instead of the captured text.
+    """
     codex_bin = find_codex()
     use_shell = sys.platform == "win32" and not codex_bin
 
@@ -44,12 +62,33 @@ def run_codex(prompt: str, timeout: int, model: str | None = None, verbose: bool
         cmd.extend(["-m", model])
     cmd.append("-")  # Read prompt from stdin
 
+    stderr = None if verbose else subprocess.DEVNULL
+
     try:
+        if output_path is not None:
+            with output_path.open("a", encoding="utf-8") as out:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.PIPE,
+                    stdout=out,
+                    stderr=stderr,
+                    text=True,
+                    shell=use_shell,
+                    encoding="utf-8",
+                )
+                try:
+                    proc.communicate(input=prompt, timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.communicate()
+                    raise TimeoutError(f"Codex timed out after {timeout}s")
+            return ""
+
         result = subprocess.run(
             cmd,
             input=prompt,
             stdout=subprocess.PIPE,
-            stderr=None if verbose else subprocess.DEVNULL,
+            stderr=stderr,
             text=True,
             timeout=timeout,
             shell=use_shell,
@@ -63,28 +102,36 @@ def run_codex(prompt: str, timeout: int, model: str | None = None, verbose: bool
         sys.exit(1)
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 review_section.py <section-file> [review-type]", file=sys.stderr)
-        sys.exit(1)
-
-    section_path = Path(sys.argv[1])
-    review_type = sys.argv[2] if len(sys.argv) > 2 else "architecture"
-    timeout = int(os.environ.get("CODEX_REVIEW_TIMEOUT", "120"))
-    verbose = os.environ.get("CODEX_REVIEW_VERBOSE", "0") == "1"
-    model = os.environ.get("CODEX_REVIEW_MODEL")
+@functools.lru_cache(maxsize=8)
+def _load_prompt(path: str) -> str:
+    """Read a prompt file once per process; repeated reviews reuse the cached text."""
+    return Path(path).read_text(encoding="utf-8")
 
-    if not section_path.is_file():
-        print(f"Error: Section file not found: {section_path}", file=sys.stderr)
-        sys.exit(1)
 
-    # Locate prompt file
+def find_prompt(review_type: str) -> Path:
+    """Resolve a review type to its prompt file, raising ValueError if unknown."""
     script_dir = Path(__file__).resolve().parent
     prompt_path = script_dir.parent / "prompts" / f"{review_type}.md"
     if not prompt_path.is_file():
         available = [p.stem for p in (script_dir.parent / "prompts").glob("*.md") if p.stem != "holistic"]
-        print(f"Error: Unknown review type '{review_type}'. Available: {', '.join(available)}", file=sys.stderr)
-        sys.exit(1)
+        raise ValueError(f"Unknown review type '{review_type}'. Available: {', '.join(available)}")
+    return prompt_path
+
+
+def review_section(
+    section_path: Path,
+    review_type: str = "architecture",
+    *,
+    timeout: int = 120,
+    model: str | None = None,
+    verbose: bool = False,
+) -> bool:
+    """Review one section file and write its feedback file.
+
+    Returns True on success, False if Codex timed out (a timeout marker is
+    written to the feedback file either way).
+    """
+    prompt_path = find_prompt(review_type)
 
     # Locate feedback directory
     # Expected structure: .codex-review/sections/<file> -> .codex-review/feedback/pass1/
@@ -97,7 +144,7 @@ def main():
     feedback_path = feedback_dir / f"{section_basename}-review.md"
 
     # Build prompt
-    review_prompt = prompt_path.read_text(encoding="utf-8")
+    review_prompt = _load_prompt(str(prompt_path))
     section_content = section_path.read_text(encoding="utf-8")
 
     full_prompt = f"""{review_prompt}
@@ -110,28 +157,55 @@ def main():
 
     print(f"Reviewing: {section_basename} (type: {review_type})...", file=sys.stderr)
 
+    # Write the header first, then stream Codex output straight into the
+    # feedback file so a timeout still leaves the partial review on disk.
+    now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    feedback_path.write_text(
+        f"# Section Review: {section_basename}\n"
+        f"**Review type**: {review_type}\n"
+        f"**Date**: {now}\n\n",
+        encoding="utf-8",
+    )
+
     try:
-        result = run_codex(full_prompt, timeout=timeout, model=model, verbose=verbose)
+        run_codex(full_prompt, timeout=timeout, model=model, verbose=verbose, output_path=feedback_path)
     except TimeoutError as e:
         print(str(e), file=sys.stderr)
-        feedback_path.write_text(
-            f"# Review: {section_basename}\n\n"
-            f"**⚠️ TIMEOUT** — Codex did not complete within {timeout}s. "
-            f"Consider increasing CODEX_REVIEW_TIMEOUT or splitting this section further.\n",
-            encoding="utf-8",
-        )
+        with feedback_path.open("a", encoding="utf-8") as fh:
+            fh.write(
+                f"\n\n**⚠️ TIMEOUT** — Codex did not complete within {timeout}s; "
+                f"output above may be partial. Consider increasing "
+                f"CODEX_REVIEW_TIMEOUT or splitting this section further.\n"
+            )
+        return False
+
+    print(f"✓ Feedback written to: {feedback_path}", file=sys.stderr)
+    return True
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python3 review_section.py <section-file> [review-type]", file=sys.stderr)
+        sys.exit(1)
+
+    section_path = Path(sys.argv[1])
+    review_type = sys.argv[2] if len(sys.argv) > 2 else "architecture"
+    timeout = _ENV_TIMEOUT
+    verbose = _ENV_VERBOSE
+    model = _ENV_MODEL
+
+    if not section_path.is_file():
+        print(f"Error: Section file not found: {section_path}", file=sys.stderr)
         sys.exit(1)
 
-    # Write feedback
-    now = datetime.now(timezone.utc).isoformat()
-    feedback = f"""# Section Review: {section_basename}
-**Review type**: {review_type}
-**Date**: {now}
+    try:
+        ok = review_section(section_path, review_type, timeout=timeout, model=model, verbose=verbose)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
-{result}
-"""
-    feedback_path.write_text(feedback, encoding="utf-8")
-    print(f"✓ Feedback written to: {feedback_path}", file=sys.stderr)
+    if not ok:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Review all extracted sections concurrently with a thread pool.
+
+Usage: python3 review_sections_batch.py <sections-dir> [review-type]
+
+Each section review is dominated by waiting on the Codex subprocess, so
+threads give near-linear speedup up to Codex's rate limit. Concurrency is
+controlled by CODEX_REVIEW_CONCURRENCY (default: 4).
+"""
+
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from review_section import find_prompt, review_section
+
+# Environment configuration, read once at import
+_ENV_TIMEOUT = int(os.environ.get("CODEX_REVIEW_TIMEOUT", "120"))
+_ENV_VERBOSE = os.environ.get("CODEX_REVIEW_VERBOSE", "0") == "1"
+_ENV_MODEL = os.environ.get("CODEX_REVIEW_MODEL")
+_ENV_CONCURRENCY = int(os.environ.get("CODEX_REVIEW_CONCURRENCY", "4"))
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python3 review_sections_batch.py <sections-dir> [review-type]", file=sys.stderr)
+        sys.exit(1)
+
+    sections_dir = Path(sys.argv[1])
+    review_type = sys.argv[2] if len(sys.argv) > 2 else "architecture"
+    timeout = _ENV_TIMEOUT
+    verbose = _ENV_VERBOSE
+    model = _ENV_MODEL
+    max_workers = _ENV_CONCURRENCY
+
+    if not sections_dir.is_dir():
+        print(f"Error: Sections directory not found: {sections_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        find_prompt(review_type)  # Validate before fanning out
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    paths = sorted(p for p in sections_dir.glob("*.md") if not p.name.startswith("_"))
+    if not paths:
+        print(f"Error: No section files found in {sections_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Reviewing {len(paths)} sections with {max_workers} workers...", file=sys.stderr)
+
+    def _review_one(path: Path) -> bool:
+        return review_section(path, review_type, timeout=timeout, model=model, verbose=verbose)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        results = list(ex.map(_review_one, paths))
+
+    failed = results.count(False)
+    print(f"Done: {len(results) - failed}/{len(results)} sections reviewed.", file=sys.stderr)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()